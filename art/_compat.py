@@ -0,0 +1,18 @@
+import sys
+from dataclasses import dataclass, fields
+
+if sys.version_info >= (3, 10):
+    slotted_dataclass = dataclass(slots=True)
+else:
+    def slotted_dataclass(cls):
+        # Backport of dataclass(slots=True): rebuild the class with
+        # __slots__ for its fields so instances carry no __dict__.
+        cls = dataclass(cls)
+        names = tuple(f.name for f in fields(cls))
+        namespace = dict(cls.__dict__)
+        for name in names + ('__dict__', '__weakref__'):
+            namespace.pop(name, None)
+        namespace['__slots__'] = names
+        slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
@@ -0,0 +1,31 @@
+from typing import Any, Union, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def lut_array(lut: Union[bytes, Tuple[int, ...]]) -> Any:
+    if isinstance(lut, bytes):
+        return np.frombuffer(lut, dtype=np.uint8)
+    return np.array(lut, dtype=np.intp)
+
+
+# Writes the symbol index of every pixel of an (H, W, 4) uint8 buffer into
+# the (H, W) `out` array, using the Symbols brightness LUT.
+def pixels_to_indices(rgba, lut, out):
+    r, g, b, a = rgba[..., 0], rgba[..., 1], rgba[..., 2], rgba[..., 3]
+    lum = (r.astype(np.uint16) + g + b) // 3
+    translucent = a < 120
+    # Most images are fully opaque; skip the per-pixel modulo when so.
+    if translucent.any():
+        lum = np.where(translucent, a % np.maximum(lum, 1), lum)
+    out[...] = lut[lum]
+
+
+# Same as pixels_to_indices, and also copies every pixel into the (H * W, 4)
+# `out_fg` array, filling TextImage-style columns (flat `out_idx`).
+def convert_frame(rgba, lut, out_idx, out_fg):
+    pixels_to_indices(rgba, lut, out_idx.reshape(rgba.shape[:2]))
+    out_fg[...] = rgba.reshape(-1, 4)
@@ -10,6 +10,11 @@ except ImportError:
     print("Error: Pillow library is required. Install with 'pip install pillow'", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .color import ANSIColor
 from .symbols import Symbols
 from .config import Config, COLORS, REVERSE
@@ -19,12 +24,18 @@ from .converter import convert_image_to_ascii, PixelImage
 class PILImageAdapter(PixelImage):    
     def __init__(self, image: Image.Image):
         self.image = image.convert('RGBA')
+        self._pixels = self.image.load()
     
     def dimensions(self) -> Tuple[int, int]:
         return self.image.size
     
     def get_pixel(self, x: int, y: int) -> Tuple[int, int, int, int]:
-        return self.image.getpixel((x, y))
+        return self._pixels[x, y]
+    
+    def as_array(self) -> Any:
+        if np is None:
+            raise ImportError("PILImageAdapter.as_array requires NumPy")
+        return np.asarray(self.image, dtype=np.uint8)
 
 
 def parse_args() -> argparse.Namespace:
@@ -1,13 +1,48 @@
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict
+
+from ._compat import slotted_dataclass
 
 ANSI_ESCAPE_CLOSE = "\033[0m"
 ANSI_FOREGROUND_ESCAPE = "\033[38;2;"
 ANSI_BACKGROUND_ESCAPE = "\033[48;2;"
 ANSI_COLOR_CODE_LEN = 12
 
+ANSI_ESCAPE_CLOSE_BYTES = ANSI_ESCAPE_CLOSE.encode('ascii')
+
+_FOREGROUND_PREFIX = ANSI_FOREGROUND_ESCAPE.encode('ascii')
+_BACKGROUND_PREFIX = ANSI_BACKGROUND_ESCAPE.encode('ascii')
+_DIGITS = [str(i).encode('ascii') for i in range(256)]
+
+# Escape codes keyed by packed (r << 16) | (g << 8) | b; images reuse far
+# fewer colors than they have pixels. Cleared when full to bound memory.
+_CACHE_LIMIT = 1 << 16
+_FG_CACHE: Dict[int, bytes] = {}
+_BG_CACHE: Dict[int, bytes] = {}
+
+
+def as_foreground_bytes(r: int, g: int, b: int) -> bytes:
+    key = (r << 16) | (g << 8) | b
+    code = _FG_CACHE.get(key)
+    if code is None:
+        if len(_FG_CACHE) >= _CACHE_LIMIT:
+            _FG_CACHE.clear()
+        code = _FOREGROUND_PREFIX + _DIGITS[r] + b';' + _DIGITS[g] + b';' + _DIGITS[b] + b'm'
+        _FG_CACHE[key] = code
+    return code
 
-@dataclass
+
+def as_background_bytes(r: int, g: int, b: int) -> bytes:
+    key = (r << 16) | (g << 8) | b
+    code = _BG_CACHE.get(key)
+    if code is None:
+        if len(_BG_CACHE) >= _CACHE_LIMIT:
+            _BG_CACHE.clear()
+        code = _BACKGROUND_PREFIX + _DIGITS[r] + b';' + _DIGITS[g] + b';' + _DIGITS[b] + b'm'
+        _BG_CACHE[key] = code
+    return code
+
+
+@slotted_dataclass
 class ANSIColor:
     r: int = 0
     g: int = 0
@@ -20,6 +55,17 @@ class ANSIColor:
             if not isinstance(val, int) or not (0 <= val <= 255):
                 setattr(self, attr, min(255, max(0, int(val))))
     
+    @classmethod
+    def unchecked(cls, r: int, g: int, b: int, a: int = 255) -> 'ANSIColor':
+        # For channel values already known to be ints in 0-255 (e.g. straight
+        # from a pixel buffer); skips the __post_init__ clamping.
+        self = cls.__new__(cls)
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        return self
+    
     @property
     def is_transparent(self) -> bool:
         return self.a < 120
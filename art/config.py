@@ -15,6 +15,14 @@ class Config:
     background: Optional[ANSIColor] = None
     flags: int = 0
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == 'background':
+            # The background is fixed for a whole render; encode its escape
+            # codes once here rather than per use.
+            self.background_bg_bytes = value.as_background().encode('ascii') if value else b''
+            self.background_fg_bytes = value.as_foreground().encode('ascii') if value else b''
+    
     @classmethod
     def new(cls, symbols: Symbols) -> 'Config':
         return cls(symbols=symbols)
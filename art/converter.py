@@ -1,15 +1,25 @@
-from typing import Tuple, Protocol, Optional, BinaryIO, TextIO, Union, Any, runtime_checkable
+from typing import Tuple, Dict, Protocol, Optional, BinaryIO, TextIO, Union, Any, runtime_checkable
 import sys
 import io
 
-from .color import ANSIColor, ANSI_ESCAPE_CLOSE
-from .symbols import Symbols
+from .color import ANSIColor, ANSI_ESCAPE_CLOSE, ANSI_ESCAPE_CLOSE_BYTES, as_foreground_bytes, as_background_bytes
+from .symbols import Symbols, sym_index_array
 from .config import Config, COLORS, REVERSE
-from .text_image import FragmentInfo, FragmentWriter
+from .text_image import FragmentInfo, FragmentWriter, TextImage
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_CELL_CACHE_LIMIT = 1 << 16
 
 
 @runtime_checkable
 class PixelImage(Protocol):
+    # Implementations may also provide `as_array() -> numpy.ndarray`, returning
+    # the whole (height, width, 4) uint8 RGBA buffer; the converter then takes
+    # the vectorized path instead of calling get_pixel per pixel.
     
     def dimensions(self) -> Tuple[int, int]:
         ...
@@ -24,6 +34,11 @@ class StreamFragmentWriter:
         self.stream = stream
         self.is_text_io = isinstance(stream, io.TextIOBase) or hasattr(stream, 'encoding')
         self.is_binary = not self.is_text_io
+        self._buf = bytearray()
+        # Fully encoded colored cells (escape codes + symbol + reset), keyed by
+        # (packed fg color, symbol) and valid for the background in _cell_bg.
+        self._cells: Dict[Tuple[int, str], bytes] = {}
+        self._cell_bg: Optional[ANSIColor] = None
     
     def background(self, bg: ANSIColor) -> bool:
         if bg.is_transparent:
@@ -39,25 +54,175 @@ class StreamFragmentWriter:
         bg: Optional[ANSIColor] = None, 
         fg: Optional[ANSIColor] = None
     ) -> None:
-        if bg:
-            self.write_bytes(bg.as_background())
+        parts = []
+        if bg and not bg.is_transparent:
+            parts.append(as_background_bytes(bg.r, bg.g, bg.b))
+        if fg and not fg.is_transparent:
+            parts.append(as_foreground_bytes(fg.r, fg.g, fg.b))
+            
+        parts.append(info.sym.encode('utf-8'))
+        
+        if bg or fg:
+            parts.append(ANSI_ESCAPE_CLOSE_BYTES)
+        
+        self._buf.extend(b''.join(parts))
+    
+    def write_sym(self, sym: str) -> None:
+        self._buf.extend(sym.encode('utf-8'))
+    
+    def write_colored_rgba(
+        self, sym: str, r: int, g: int, b: int, a: int,
+        bg: Optional[ANSIColor] = None
+    ) -> None:
+        if bg is not self._cell_bg:
+            self._cells.clear()
+            self._cell_bg = bg
+        
+        key = ((r << 16) | (g << 8) | b if a >= 120 else -1, sym)
+        cell = self._cells.get(key)
+        if cell is None:
+            if len(self._cells) >= _CELL_CACHE_LIMIT:
+                self._cells.clear()
+            cell = self._cells[key] = self._build_cell(sym, r, g, b, a, bg)
+        self._buf.extend(cell)
+    
+    def _build_cell(
+        self, sym: str, r: int, g: int, b: int, a: int,
+        bg: Optional[ANSIColor]
+    ) -> bytes:
+        parts = []
+        if bg and not bg.is_transparent:
+            parts.append(as_background_bytes(bg.r, bg.g, bg.b))
+        fg = a >= 120
         if fg:
-            self.write_bytes(fg.as_foreground())
+            parts.append(as_foreground_bytes(r, g, b))
             
-        self.write_bytes(info.sym)
+        parts.append(sym.encode('utf-8'))
         
         if bg or fg:
-            self.write_bytes(ANSI_ESCAPE_CLOSE)
+            parts.append(ANSI_ESCAPE_CLOSE_BYTES)
+        
+        return b''.join(parts)
     
     def write_bytes(self, data: Union[bytes, str]) -> None:
+        self._buf.extend(data if isinstance(data, bytes) else data.encode('utf-8'))
+    
+    def flush(self) -> None:
+        if not self._buf:
+            return
         if self.is_text_io:
-            if isinstance(data, bytes):
-                data = data.decode('utf-8')
-            self.stream.write(data)
+            self.stream.write(self._buf.decode('utf-8'))
         else:
-            if isinstance(data, str):
-                data = data.encode('utf-8')
-            self.stream.write(data)
+            self.stream.write(bytes(self._buf))
+        self._buf.clear()
+
+
+def _pixel_array(image: PixelImage) -> Optional[Any]:
+    if np is None:
+        return None
+    as_array = getattr(image, 'as_array', None)
+    if as_array is None:
+        return None
+    return as_array()
+
+
+def _write_symbol_grid(symbols: Symbols, rgba: Any, output: StreamFragmentWriter) -> None:
+    idx = sym_index_array(rgba, symbols)
+    height, width = idx.shape
+    encoded = [sym.encode('utf-8') for sym in symbols.set]
+    size = len(encoded[0])
+    
+    if size and all(len(sym) == size for sym in encoded):
+        # Equal-width encodings: gather the bytes of every cell and append a
+        # newline column, producing the whole output in one array.
+        table = np.frombuffer(b''.join(encoded), dtype=np.uint8).reshape(-1, size)
+        rows = np.empty((height, width * size + 1), dtype=np.uint8)
+        rows[:, :-1] = table[idx].reshape(height, width * size)
+        rows[:, -1] = ord('\n')
+        output.write_bytes(rows.tobytes())
+    else:
+        grid = symbols._char_lut[idx]
+        output.write_bytes(''.join(''.join(row) + '\n' for row in grid.tolist()))
+
+
+def _index_pixels(config: Config, image: PixelImage, output: TextImage) -> None:
+    width, height = image.dimensions()
+    get_pixel = image.get_pixel
+    sym_index = config.symbols.sym_index
+    write_indexed = output.write_indexed
+    
+    for y in range(height):
+        for x in range(width):
+            pixel = get_pixel(x, y)
+            write_indexed(sym_index(pixel), pixel)
+
+
+def _write_pixels(config: Config, image: PixelImage, output: StreamFragmentWriter) -> None:
+    width, height = image.dimensions()
+    get_pixel = image.get_pixel
+    sym_and_index = config.symbols.sym_and_index
+    write_sym = output.write_sym
+    write_nl = output.write_bytes
+    
+    for y in range(height):
+        for x in range(width):
+            write_sym(sym_and_index(get_pixel(x, y))[0])
+            
+        write_nl('\n')
+
+
+def _write_colored_pixels(config: Config, image: PixelImage, output: StreamFragmentWriter) -> None:
+    width, height = image.dimensions()
+    get_pixel = image.get_pixel
+    sym_and_index = config.symbols.sym_and_index
+    write_colored = output.write_colored_rgba
+    write_nl = output.write_bytes
+    bg = config.background
+    
+    for y in range(height):
+        for x in range(width):
+            pixel = get_pixel(x, y)
+            r, g, b, a = pixel
+            write_colored(sym_and_index(pixel)[0], r, g, b, a, bg)
+            
+        write_nl('\n')
+
+
+def _write_fragments(config: Config, image: PixelImage, output: FragmentWriter) -> None:
+    width, height = image.dimensions()
+    get_pixel = image.get_pixel
+    sym_and_index = config.symbols.sym_and_index
+    unchecked = ANSIColor.unchecked
+    write_frag = output.write_fragment
+    write_nl = output.write_bytes
+    
+    for y in range(height):
+        for x in range(width):
+            pixel = get_pixel(x, y)
+            sym, sym_index = sym_and_index(pixel)
+            write_frag(FragmentInfo(sym=sym, sym_index=sym_index, fg=unchecked(*pixel)))
+            
+        write_nl('\n')
+
+
+def _write_colored_fragments(config: Config, image: PixelImage, output: FragmentWriter) -> None:
+    width, height = image.dimensions()
+    get_pixel = image.get_pixel
+    sym_and_index = config.symbols.sym_and_index
+    unchecked = ANSIColor.unchecked
+    write_colored = output.write_colored_fragment
+    write_nl = output.write_bytes
+    bg = config.background
+    
+    for y in range(height):
+        for x in range(width):
+            pixel = get_pixel(x, y)
+            sym, sym_index = sym_and_index(pixel)
+            fg = unchecked(*pixel)
+            fi = FragmentInfo(sym=sym, sym_index=sym_index, fg=fg)
+            write_colored(fi, bg, fg if fg.a >= 120 else None)
+            
+        write_nl('\n')
 
 
 def convert_image_to_ascii(
@@ -65,10 +230,10 @@ def convert_image_to_ascii(
     image: PixelImage, 
     output: Union[FragmentWriter, TextIO, BinaryIO]
 ) -> None:
-    if not isinstance(output, FragmentWriter):
+    # A single attribute probe; isinstance against the runtime_checkable
+    # FragmentWriter protocol checks every protocol member.
+    if not hasattr(output, 'write_fragment'):
         output = StreamFragmentWriter(output)
-        
-    width, height = image.dimensions()
     
     ansi_close = False
     if config.background:
@@ -77,34 +242,30 @@ def convert_image_to_ascii(
     
     colored = config.use_colors
     
-    for y in range(height):
-        for x in range(width):
-            pixel = image.get_pixel(x, y)
-            
-            if colored:
-                r, g, b, a = pixel
-                sym, sym_index = config.symbols.sym_and_index(pixel)
-                fg = ANSIColor(r, g, b, a)
-                
-                fi = FragmentInfo(sym=sym, sym_index=sym_index, fg=fg)
-                
-                fg_color = fg if not fg.is_transparent else None
-                bg_color = config.background
-                
-                if ansi_close and config.reversed:
-                    fg_color, bg_color = bg_color, fg_color
-                    
-                output.write_colored_fragment(fi, bg_color, fg_color)
-            else:
-                sym, sym_index = config.symbols.sym_and_index(pixel)
-                r, g, b, a = pixel
-                output.write_fragment(FragmentInfo(
-                    sym=sym, 
-                    sym_index=sym_index,
-                    fg=ANSIColor(r, g, b, a)
-                ))
-                
-        output.write_bytes('\n')
+    if isinstance(output, TextImage):
+        rgba = _pixel_array(image)
+        if rgba is not None:
+            output.write_frame(rgba, config.symbols)
+        else:
+            _index_pixels(config, image, output)
+    elif isinstance(output, StreamFragmentWriter):
+        rgba = None
+        if not colored and not config.symbols.is_empty():
+            rgba = _pixel_array(image)
+        
+        if rgba is not None:
+            _write_symbol_grid(config.symbols, rgba, output)
+        elif colored:
+            _write_colored_pixels(config, image, output)
+        else:
+            _write_pixels(config, image, output)
+    elif colored:
+        _write_colored_fragments(config, image, output)
+    else:
+        _write_fragments(config, image, output)
     
     if ansi_close:
-        output.write_bytes(ANSI_ESCAPE_CLOSE)
\ No newline at end of file
+        output.write_bytes(ANSI_ESCAPE_CLOSE)
+    
+    if isinstance(output, StreamFragmentWriter):
+        output.flush()
\ No newline at end of file
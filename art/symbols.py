@@ -1,10 +1,52 @@
-from typing import List, Tuple, Union, Optional
+from typing import List, Tuple, Union, Optional, Any
 from dataclasses import dataclass
 
+from ._kernels import pixels_to_indices, lut_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Constants
 EMPTY_CHAR = ' '
 
 
+class _SymbolList(list):
+    # The list behind Symbols.set; every in-place change rebuilds the owner's
+    # lookup tables, so they never go stale.
+    __slots__ = ('_owner',)
+    
+    def __init__(self, symbols, owner):
+        super().__init__(symbols)
+        self._owner = owner
+    
+    def _changed(self):
+        # Unpickling and copying refill the list before `_owner` is restored.
+        owner = getattr(self, '_owner', None)
+        if owner is not None:
+            owner._build_lut()
+
+
+def _rebuilding(name):
+    method = getattr(list, name)
+    
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+    
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+    '__setitem__', '__delitem__', '__iadd__', '__imul__'
+):
+    setattr(_SymbolList, _name, _rebuilding(_name))
+
+
 @dataclass
 class Symbols:
     set: List[str] = None
@@ -13,44 +55,79 @@ class Symbols:
         if self.set is None:
             self.set = []
     
+    def __setattr__(self, name, value):
+        if name == 'set' and value is not None:
+            value = _SymbolList(value, self)
+        super().__setattr__(name, value)
+        if name == 'set':
+            self._build_lut()
+    
+    def _build_lut(self):
+        # Brightness (0-255) -> symbol index, so per-pixel work is a table lookup.
+        symbols = self.set or []
+        length = len(symbols)
+        self._length = length
+        self._is_empty = length == 0
+        # One trailing pad entry so `get` clamps with a single min().
+        self._padded = list(symbols) + [symbols[-1] if symbols else EMPTY_CHAR]
+        # Symbol for every index a one-byte index column can hold.
+        self._idx_chars = tuple(self._padded[min(i, length)] for i in range(256))
+        lut = [min(i * length // 256, length - 1) if length else 0 for i in range(256)]
+        self._lut = bytes(lut) if length <= 256 else tuple(lut)
+        self._sym_lut = tuple(symbols[i] if length else EMPTY_CHAR for i in lut)
+        self._encoded = tuple(sym.encode('utf-8') for sym in symbols or [EMPTY_CHAR])
+        # Index -> ASCII byte translation table, when every symbol is a single
+        # ASCII character; lets uncolored output skip str building and encoding.
+        cells = symbols or [EMPTY_CHAR]
+        if all(len(sym) == 1 and sym.isascii() for sym in cells):
+            self._byte_lut = bytes(ord(cells[min(i, len(cells) - 1)]) for i in range(256))
+        else:
+            self._byte_lut = None
+        if np is not None:
+            self._lut_array = lut_array(self._lut)
+            self._char_lut = np.array(symbols or [EMPTY_CHAR], dtype=str)
+        else:
+            self._lut_array = self._char_lut = None
+    
     @classmethod
     def empty(cls) -> 'Symbols':
         return cls([])
     
     def get(self, idx: int) -> str:
-        if self.is_empty():
-            return EMPTY_CHAR
-        if idx >= len(self.set):
-            return self.set[-1]
-        return self.set[idx]
+        if idx < 0:
+            # Python indexing from the end, as a plain list lookup would do.
+            return self.set[idx] if self._length else EMPTY_CHAR
+        return self._padded[min(idx, self._length)]
     
     def sym_index(self, pixel: Tuple[int, int, int, int]) -> int:
-        if self.is_empty():
-            return 0
-            
         r, g, b, a = pixel
-        
-        length = len(self.set)
         idx = (r + g + b) // 3
-        
-        if idx == 0:
-            return 0
-            
-        if a < 120:
-            idx = a % (idx or 1)
-            
-        idx = idx * length // 256
-        
-        return min(idx, length - 1)
+        # `a % 1` is 0, so black translucent pixels need no separate case.
+        return self._lut[idx if a >= 120 else a % (idx or 1)]
+    
+    def brightness_to_indices(self, brightness: Any) -> Any:
+        # Vectorized LUT lookup for an integer array of 0-255 brightness values.
+        return self._lut_array[brightness]
     
     def sym_and_index(self, pixel: Tuple[int, int, int, int]) -> Tuple[str, int]:
-        idx = self.sym_index(pixel)
-        return self.get(idx), idx
+        r, g, b, a = pixel
+        idx = (r + g + b) // 3
+        idx = idx if a >= 120 else a % (idx or 1)
+        return self._sym_lut[idx], self._lut[idx]
     
     def __len__(self) -> int:
-        return len(self.set)
+        return self._length
     
     def is_empty(self) -> bool:
-        return len(self.set) == 0
+        return self._is_empty
+
+EMPTY_SET = Symbols.empty()
+
 
-EMPTY_SET = Symbols.empty()
\ No newline at end of file
+def sym_index_array(rgba: Any, symbols: Symbols) -> Any:
+    # Batched sym_index over a contiguous (H, W, 4) uint8 RGBA array; returns
+    # the (H, W) grid of symbol indices. Requires NumPy.
+    lut = symbols._lut_array
+    out = np.empty(rgba.shape[:2], dtype=lut.dtype)
+    pixels_to_indices(rgba, lut, out)
+    return out
\ No newline at end of file
@@ -1,20 +1,31 @@
-from typing import List, Optional, Tuple, Dict, Any, Protocol, runtime_checkable, Union
-import io
-from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Dict, Any, BinaryIO, Protocol, runtime_checkable, Union
+from array import array
+from collections.abc import Sequence
+from dataclasses import field
 
-from .color import ANSIColor, TRANSPARENT, ANSI_ESCAPE_CLOSE
+from .color import (
+    ANSIColor, TRANSPARENT, ANSI_ESCAPE_CLOSE_BYTES,
+    as_foreground_bytes, as_background_bytes
+)
 from .symbols import Symbols
 from .config import Config
+from ._compat import slotted_dataclass
+from ._kernels import convert_frame
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
+
+@slotted_dataclass
 class FragmentInfo:
     sym: str
     sym_index: int
     fg: ANSIColor = field(default_factory=lambda: TRANSPARENT)
 
 
-@dataclass
+@slotted_dataclass
 class IndexedFragment:
     sym_index: int
     fg: ANSIColor = field(default_factory=lambda: TRANSPARENT)
@@ -31,7 +42,7 @@ class IndexedFragment:
         return cls(sym_index=sym_index, fg=fg)
 
 
-@dataclass
+@slotted_dataclass
 class Fragment:
     ch: str
     fg: ANSIColor = field(default_factory=lambda: TRANSPARENT)
@@ -75,105 +86,361 @@ class FragmentWriter(Protocol):
         ...
 
 
+# Packed-color key for cells whose foreground is transparent (no prefix).
+_NO_COLOR = 1 << 24
+
+class FragmentView(Sequence):
+    # Live, read-only sequence of a TextImage's written cells; each item is
+    # built from the columns on access.
+    __slots__ = ('_image',)
+    
+    def __init__(self, image: 'TextImage'):
+        self._image = image
+    
+    def __len__(self) -> int:
+        return self._image._len
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('fragment index out of range')
+        return self._image._indexed_unchecked(idx)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class TextImage:
     def __init__(self, config: Config, width: int, height: int):
         self.config = config
-        self.fragments: List[IndexedFragment] = []
         self.row_len = width
         self.height = height
+        # Fragments are stored column-wise: one symbol index and one RGBA
+        # quadruple per cell, in flat contiguous buffers.
+        size = width * height
+        self._idx_max = 0xFF if len(config.symbols) <= 256 else 0xFFFFFFFF
+        self._idx = array('B' if self._idx_max == 0xFF else 'I', [0]) * size
+        self._rgba = bytearray(size * 4)
+        self._len = 0
+    
+    @property
+    def fragments(self) -> 'FragmentView':
+        # Read-only: write through insert/put/write_* instead.
+        return FragmentView(self)
+    
+    # NumPy copies of the written part of the columns.
+    @property
+    def sym_idx(self) -> Any:
+        self._require_numpy('sym_idx')
+        return self._sym_idx_view().copy()
+    
+    @property
+    def fg(self) -> Any:
+        self._require_numpy('fg')
+        return self._fg_view().copy()
+    
+    @property
+    def packed_fg(self) -> Any:
+        # Each cell's RGBA as one little-endian r | g << 8 | b << 16 | a << 24 word.
+        self._require_numpy('packed_fg')
+        return self._packed_fg_view().copy()
+    
+    @staticmethod
+    def _require_numpy(name: str) -> None:
+        if np is None:
+            raise ImportError(f"TextImage.{name} requires NumPy")
+    
+    # Zero-copy views for the renderers; they must not outlive the call, as
+    # the storage cannot grow while a view exports its buffer.
+    def _sym_idx_view(self) -> Any:
+        return np.frombuffer(self._idx, dtype=self._idx.typecode)[:self._len]
+    
+    def _fg_view(self) -> Any:
+        return np.frombuffer(self._rgba, dtype=np.uint8)[:self._len * 4].reshape(-1, 4)
+    
+    def _packed_fg_view(self) -> Any:
+        return np.frombuffer(self._rgba, dtype='<u4')[:self._len]
     
     def fragment_at(self, x: int, y: int) -> Optional[Fragment]:
         idx = y * self.row_len + x
         return self.get(idx)
     
     def get(self, idx: int) -> Optional[Fragment]:
-        if idx < len(self.fragments):
+        # Negative indices count from the last written cell, not from the
+        # end of the preallocated storage.
+        if idx < 0:
+            idx += self._len
+            if idx < 0:
+                raise IndexError('fragment index out of range')
+        if idx < self._len:
             return self._get_unchecked(idx)
         return None
     
+    def _get_char_unchecked(self, idx: int) -> str:
+        return self.config.symbols.get(self._idx[idx])
+    
+    def _get_fg_unchecked(self, idx: int) -> ANSIColor:
+        return ANSIColor.unchecked(*self._rgba[idx * 4:idx * 4 + 4])
+    
+    def _indexed_unchecked(self, idx: int) -> IndexedFragment:
+        return IndexedFragment(sym_index=self._idx[idx], fg=self._get_fg_unchecked(idx))
+    
     def _get_unchecked(self, idx: int) -> Fragment:
-        fragment = self.fragments[idx]
-        return Fragment(
-            ch=self.config.symbols.get(fragment.sym_index),
-            fg=fragment.fg
-        )
+        return Fragment(ch=self._get_char_unchecked(idx), fg=self._get_fg_unchecked(idx))
     
     def _fragment_at_unchecked(self, x: int, y: int) -> Fragment:
         return self._get_unchecked(y * self.row_len + x)
     
+    def _reserve(self, size: int) -> None:
+        # Only reached for writes past width * height; grow by at least the
+        # current capacity so repeated overflow writes stay amortized O(1).
+        missing = size - len(self._idx)
+        if missing > 0:
+            missing = max(missing, len(self._idx))
+            self._idx.extend(array(self._idx.typecode, [0]) * missing)
+            self._rgba.extend(bytes(missing * 4))
+    
+    def _store_index(self, idx: int, sym_index: int) -> None:
+        # The column only holds 0.._idx_max, so other indices are resolved at
+        # write time: negative ones count from the end of the symbol set, as
+        # Symbols.get does (clamped at the first symbol), and too-large ones
+        # clamp to the column maximum, which reads back as the last symbol.
+        # In-range writes pay only for the try.
+        try:
+            self._idx[idx] = sym_index
+        except OverflowError:
+            if sym_index < 0:
+                sym_index = max(0, sym_index + len(self.config.symbols))
+            self._idx[idx] = min(sym_index, self._idx_max)
+    
+    def _store(self, idx: int, sym_index: int, fg: ANSIColor) -> None:
+        self._store_index(idx, sym_index)
+        self._rgba[idx * 4:idx * 4 + 4] = (fg.r, fg.g, fg.b, fg.a)
+    
     def insert(self, idx: int, fragment: IndexedFragment) -> None:
-        if idx >= len(self.fragments):
-            # Extend the list if necessary
-            self.fragments.extend([IndexedFragment(0)] * (idx - len(self.fragments) + 1))
-        self.fragments[idx] = fragment
+        # Negative indices count from the last written cell, as in get.
+        if idx < 0:
+            idx += self._len
+            if idx < 0:
+                raise IndexError('fragment index out of range')
+        # Storage is preallocated for width * height cells, so growing is
+        # only needed for writes past the declared dimensions.
+        if idx >= len(self._idx):
+            self._reserve(idx + 1)
+        if idx >= self._len:
+            self._len = idx + 1
+        self._store(idx, fragment.sym_index, fragment.fg)
     
     def put(self, x: int, y: int, fragment: IndexedFragment) -> None:
         self.insert(y * self.row_len + x, fragment)
     
     def __len__(self) -> int:
-        return len(self.fragments)
+        return self._len
     
     def is_empty(self) -> bool:
-        return len(self.fragments) == 0
+        return self._len == 0
     
     def __str__(self) -> str:
-        result = io.StringIO()
+        if not self.config.use_colors:
+            return self._fmt()
         
+        # Everything is appended as encoded bytes and decoded once at the end.
+        result = bytearray()
+        self._color_fmt(result)
+        return result.decode('utf-8')
+    
+    def __bytes__(self) -> bytes:
         if self.config.use_colors:
+            result = bytearray()
             self._color_fmt(result)
+            return bytes(result)
+        
+        lut = self.config.symbols._byte_lut
+        row_len = self.row_len
+        if lut is None or self._idx.typecode != 'B' or row_len <= 0:
+            return self._fmt().encode('utf-8')
+        
+        data = self._idx[:self._len].tobytes().translate(lut)
+        return b'\n'.join(data[i:i + row_len] for i in range(0, self._len, row_len))
+    
+    def to_bytes(self, stream: BinaryIO) -> None:
+        stream.write(bytes(self))
+    
+    def _fmt(self) -> str:
+        row_len = self.row_len
+        if np is not None and self._len and row_len > 0:
+            symbols = self.config.symbols
+            table = symbols._char_lut
+            chars = table[np.minimum(self._sym_idx_view(), len(table) - 1)]
+            if table.dtype.itemsize == 4 and all(symbols.set) and self._len % row_len == 0:
+                # One code point per cell: reinterpret each row of cells as a
+                # single fixed-width string, so rows are built in C.
+                return '\n'.join(chars.view(f'U{row_len}').tolist())
+            chars = chars.tolist()
+            return '\n'.join(
+                ''.join(chars[i:i + row_len]) for i in range(0, self._len, row_len)
+            )
+        
+        symbols = self.config.symbols
+        if self._idx.typecode == 'B':
+            # Byte indices map through a full 256-entry table, so the column
+            # is iterated by map() without a per-cell clamp.
+            cells = list(map(symbols._idx_chars.__getitem__, self._idx[:self._len]))
         else:
-            self._fmt(result)
-            
-        return result.getvalue()
-    
-    def _fmt(self, buffer: io.StringIO) -> None:
-        i = 0
-        for frag in self.fragments:
-            if i == self.row_len:
-                i = 0
-                buffer.write('\n')
-            buffer.write(self.config.symbols.get(frag.sym_index))
-            i += 1
-    
-    def _color_fmt(self, buffer: io.StringIO) -> None:
+            cells = [symbols.get(si) for si in self._idx[:self._len]]
+        if row_len <= 0:
+            return ('\n' if cells and not row_len else '') + ''.join(cells)
+        return '\n'.join(
+            ''.join(cells[i:i + row_len]) for i in range(0, self._len, row_len)
+        )
+    
+    def _color_cells(self, buffer: bytearray) -> None:
+        # Vectorized colored render for complete rows, emitting the same
+        # per-run escape codes as _color_runs. Every distinct
+        # color's escape code is built once; run openers, symbols and row
+        # endings are gathered into one object array and joined in one call.
+        height, width = self._len // self.row_len, self.row_len
+        packed = self._packed_fg_view()
+        packed = np.where(packed >= 120 << 24, packed & 0xFFFFFF, _NO_COLOR).reshape(height, width)
+        keys, inverse = np.unique(packed, return_inverse=True)
+        inverse = inverse.reshape(height, width)
+        colored = packed != _NO_COLOR
+        
+        color_code = as_background_bytes if self.config.reversed else as_foreground_bytes
+        prefixes = [
+            color_code(k & 0xFF, (k >> 8) & 0xFF, k >> 16) if k != _NO_COLOR else b''
+            for k in keys.tolist()
+        ]
+        # Opener table: [prefix..., reset + prefix..., nothing].
+        openers = np.empty(2 * len(keys) + 1, dtype=object)
+        openers[:] = prefixes + [ANSI_ESCAPE_CLOSE_BYTES + p for p in prefixes] + [b'']
+        
+        starts = np.ones((height, width), dtype=bool)
+        starts[:, 1:] = packed[:, 1:] != packed[:, :-1]
+        closes = np.zeros((height, width), dtype=bool)
+        closes[:, 1:] = colored[:, :-1]
+        opener_idx = np.where(starts, inverse + closes * len(keys), 2 * len(keys))
+        
+        encoded = self.config.symbols._encoded
+        syms = np.empty(len(encoded), dtype=object)
+        syms[:] = encoded
+        
+        cells = np.empty((height, 2 * width + 1), dtype=object)
+        cells[:, 0:-1:2] = openers[opener_idx]
+        cells[:, 1:-1:2] = syms[np.minimum(self._sym_idx_view(), len(encoded) - 1)].reshape(height, width)
+        cells[:, -1] = np.where(colored[:, -1], ANSI_ESCAPE_CLOSE_BYTES + b'\n', b'\n')
+        parts = cells.reshape(-1).tolist()
+        parts[-1] = parts[-1][:-1]
+        buffer.extend(b''.join(parts))
+    
+    def _color_runs(self, buffer: bytearray) -> None:
+        # Per-cell colored render. Runs of equal colors share one escape code
+        # and one reset, which is written when the color changes and at the
+        # end of every row.
+        syms = self.config.symbols._encoded
+        size = len(syms)
+        last = syms[-1]
+        color_code = as_background_bytes if self.config.reversed else as_foreground_bytes
+        close = ANSI_ESCAPE_CLOSE_BYTES
+        idx = self._idx
+        rgba = self._rgba
+        count = self._len
+        
+        # Parts are gathered in a list and joined once into the buffer.
+        parts: List[bytes] = []
+        append = parts.append
+        row_len = self.row_len
+        if row_len <= 0:
+            # Zero-width rows: a single line, behind one leading newline.
+            if count and not row_len:
+                append(b'\n')
+            row_len = count or 1
+        
+        for start in range(0, count, row_len):
+            if start:
+                append(b'\n')
+            prev = _NO_COLOR
+            for n in range(start, min(start + row_len, count)):
+                si = idx[n]
+                r, g, b, a = rgba[n * 4:n * 4 + 4]
+                key = (r << 16) | (g << 8) | b if a >= 120 else _NO_COLOR
+                if key != prev:
+                    if prev != _NO_COLOR:
+                        append(close)
+                    if key != _NO_COLOR:
+                        append(color_code(r, g, b))
+                    prev = key
+                append(syms[si] if si < size else last)
+            if prev != _NO_COLOR:
+                append(close)
+        buffer.extend(b''.join(parts))
+    
+    def _color_fmt(self, buffer: bytearray) -> None:
+        config = self.config
+        background = config.background
         has_background = False
         
-        if self.config.reversed:
-            if self.config.background and not self.config.background.is_transparent:
-                buffer.write(str(self.config.background))
+        if config.reversed:
+            if background and not background.is_transparent:
+                buffer.extend(config.background_fg_bytes)
                 has_background = True
         else:
-            if self.config.background:
-                buffer.write(self.config.background.as_background())
+            if background:
+                buffer.extend(config.background_bg_bytes)
                 has_background = True
         
-        i = 0
-        for frag in self.fragments:
-            if i == self.row_len:
-                i = 0
-                buffer.write('\n')
-            i += 1
-            
-            sym = self.config.symbols.get(frag.sym_index)
-            
-            if self.config.reversed:
-                buffer.write(f"{frag.fg:-}")
-            else:
-                buffer.write(f"{frag.fg}")
-                
-            buffer.write(f"{sym}{ANSI_ESCAPE_CLOSE}")
+        if np is not None and self._len and self.row_len > 0 and self._len % self.row_len == 0:
+            self._color_cells(buffer)
+        else:
+            self._color_runs(buffer)
         
         if has_background:
-            buffer.write(ANSI_ESCAPE_CLOSE)
+            buffer.extend(ANSI_ESCAPE_CLOSE_BYTES)
     
     def background(self, bg: ANSIColor) -> bool:
         return True
     
     def write_fragment(self, info: FragmentInfo) -> None:
-        self.fragments.append(IndexedFragment(
-            sym_index=info.sym_index,
-            fg=info.fg
-        ))
+        n = self._len
+        if n >= len(self._idx):
+            self._reserve(n + 1)
+        self._store(n, info.sym_index, info.fg)
+        self._len = n + 1
+    
+    def write_indexed(self, sym_index: int, rgba: Tuple[int, int, int, int]) -> None:
+        n = self._len
+        if n >= len(self._idx):
+            self._reserve(n + 1)
+        self._store_index(n, sym_index)
+        self._rgba[n * 4:n * 4 + 4] = rgba
+        self._len = n + 1
+    
+    def write_frame(self, rgba: Any, symbols: Symbols) -> None:
+        # Bulk write of a whole (H, W, 4) uint8 RGBA buffer: symbol indices
+        # and colors are written straight into the columns in one pass.
+        count = rgba.shape[0] * rgba.shape[1]
+        n = self._len
+        if n + count > len(self._idx):
+            self._reserve(n + count)
+        # The LUT may come from a larger symbol set than the column was sized
+        # for; clamp it as _store_index would, rather than let NumPy wrap.
+        lut = symbols._lut_array
+        if len(symbols) > self._idx_max:
+            lut = np.minimum(lut, self._idx_max)
+        convert_frame(
+            rgba, lut,
+            np.frombuffer(self._idx, dtype=self._idx.typecode)[n:n + count],
+            np.frombuffer(self._rgba, dtype=np.uint8)[n * 4:(n + count) * 4].reshape(-1, 4),
+        )
+        self._len = n + count
     
     def write_colored_fragment(
         self, info: FragmentInfo, 
@@ -0,0 +1,88 @@
+import io
+import random
+import unittest
+
+from art import ANSIColor, Config, Symbols, TextImage, COLORS, REVERSE, convert_image_to_ascii
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ListImage:
+    # PixelImage without as_array: always takes the per-pixel paths.
+    
+    def __init__(self, width, height, pixels):
+        self.width = width
+        self.height = height
+        self.pixels = pixels
+    
+    def dimensions(self):
+        return self.width, self.height
+    
+    def get_pixel(self, x, y):
+        return self.pixels[y * self.width + x]
+
+
+class ArrayImage(ListImage):
+    
+    def as_array(self):
+        return np.array(self.pixels, dtype=np.uint8).reshape(self.height, self.width, 4)
+
+
+def _palette_pixels(count, seed=3):
+    # Repeated colors make runs; low alpha values exercise transparency.
+    rng = random.Random(seed)
+    palette = [
+        (255, 0, 0, 255), (0, 255, 0, 255), (30, 60, 90, 200),
+        (200, 200, 200, 119), (9, 9, 9, 50), (0, 0, 0, 0), (255, 255, 255, 255),
+    ]
+    return [rng.choice(palette) for _ in range(count)]
+
+
+def _convert(config, image):
+    text = io.StringIO()
+    convert_image_to_ascii(config, image, text)
+    binary = io.BytesIO()
+    convert_image_to_ascii(config, image, binary)
+    text_image = TextImage(config, *image.dimensions())
+    convert_image_to_ascii(config, image, text_image)
+    return text.getvalue(), binary.getvalue(), str(text_image)
+
+
+class ConvertTest(unittest.TestCase):
+    
+    def test_plain_output(self):
+        image = ListImage(2, 2, [(255, 255, 255, 255), (0, 0, 0, 255), (0, 0, 0, 0), (255, 255, 255, 255)])
+        text, binary, text_image = _convert(Config(Symbols(list(' #'))), image)
+        self.assertEqual(text, '# \n #\n')
+        self.assertEqual(binary, b'# \n #\n')
+        self.assertEqual(text_image, '# \n #')
+
+
+@unittest.skipIf(np is None, 'requires NumPy')
+class ConvertParityTest(unittest.TestCase):
+    
+    def test_array_and_per_pixel_paths_match(self):
+        width, height = 11, 6
+        pixels = _palette_pixels(width * height)
+        backgrounds = (None, ANSIColor(40, 40, 40), ANSIColor(1, 2, 3, 0))
+        
+        for symbols in ('', ' .:-=+*#%@', ' ░▒▓█'):
+            for flags in (0, COLORS, REVERSE, COLORS | REVERSE):
+                for background in backgrounds:
+                    config = Config(Symbols(list(symbols)), background=background, flags=flags)
+                    case = (symbols, flags, background)
+                    
+                    array_out = _convert(config, ArrayImage(width, height, pixels))
+                    pixel_out = _convert(config, ListImage(width, height, pixels))
+                    
+                    self.assertEqual(array_out, pixel_out, case)
+                    text, binary, _ = array_out
+                    self.assertEqual(text.encode('utf-8'), binary, case)
+                    self.assertEqual(text.count('\n'), height, case)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from art.symbols import Symbols, EMPTY_CHAR
+
+
+WHITE = (255, 255, 255, 255)
+
+
+class SymbolsTest(unittest.TestCase):
+    
+    def test_get_clamps_to_last_symbol(self):
+        symbols = Symbols(list('abc'))
+        self.assertEqual([symbols.get(i) for i in range(5)], list('abccc'))
+        self.assertEqual(Symbols().get(3), EMPTY_CHAR)
+    
+    def test_get_negative_index_counts_from_the_end(self):
+        symbols = Symbols(list('abc'))
+        self.assertEqual([symbols.get(i) for i in (-1, -2, -3)], list('cba'))
+        with self.assertRaises(IndexError):
+            symbols.get(-4)
+        self.assertEqual(Symbols().get(-1), EMPTY_CHAR)
+    
+    def test_append_rebuilds_tables(self):
+        symbols = Symbols()
+        symbols.set.append('#')
+        symbols.set.append('@')
+        self.assertEqual(symbols.sym_index(WHITE), 1)
+        self.assertEqual(symbols.get(1), '@')
+        self.assertEqual(symbols.sym_and_index(WHITE), ('@', 1))
+    
+    def test_length_follows_mutation(self):
+        symbols = Symbols()
+        self.assertTrue(symbols.is_empty())
+        symbols.set.append('#')
+        symbols.set.extend('@')
+        self.assertFalse(symbols.is_empty())
+        self.assertEqual(len(symbols), 2)
+        symbols.set.clear()
+        self.assertTrue(symbols.is_empty())
+        self.assertEqual(len(symbols), 0)
+    
+    def test_slice_assignment_rebuilds_tables(self):
+        symbols = Symbols(list('ab'))
+        symbols.set[:] = list('abcd')
+        self.assertEqual(symbols.get(symbols.sym_index(WHITE)), 'd')
+    
+    def test_reassignment_rebuilds_tables(self):
+        symbols = Symbols(list('ab'))
+        symbols.set = list('xyz')
+        self.assertEqual(symbols.sym_and_index(WHITE), ('z', 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import random
+import unittest
+
+from art import Config, Symbols, TextImage, IndexedFragment, COLORS, REVERSE
+from art.text_image import FragmentInfo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _random_pixels(count, seed=1):
+    rng = random.Random(seed)
+    return [tuple(rng.randrange(256) for _ in range(4)) for _ in range(count)]
+
+
+class TextImageTest(unittest.TestCase):
+    
+    def test_writers_clamp_out_of_range_indices(self):
+        image = TextImage(Config(Symbols(list('abc'))), 3, 2)
+        image.write_fragment(FragmentInfo('x', 300))
+        image.write_fragment(FragmentInfo('x', -1))
+        image.write_indexed(1000, (0, 0, 0, 255))
+        image.write_indexed(-5, (0, 0, 0, 255))
+        image.insert(4, IndexedFragment(300))
+        image.insert(5, IndexedFragment(-1))
+        # Negative indices resolve like Symbols.get: -1 is the last symbol,
+        # and ones past the start of the set clamp to the first.
+        self.assertEqual(str(image), 'ccc\nacc')
+    
+    def test_get_negative_index_counts_from_last_written_cell(self):
+        image = TextImage(Config(Symbols(list('abc'))), 4, 4)
+        image.write_indexed(0, (1, 2, 3, 255))
+        image.write_indexed(2, (4, 5, 6, 255))
+        self.assertEqual(image.get(-1).ch, 'c')
+        self.assertEqual(image.get(-1).fg.r, 4)
+        self.assertEqual(image.get(-2).ch, 'a')
+        self.assertIsNone(image.get(2))
+        with self.assertRaises(IndexError):
+            image.get(-3)
+    
+    def test_insert_negative_index_counts_from_last_written_cell(self):
+        image = TextImage(Config(Symbols(list('abc'))), 2, 2)
+        image.insert(0, IndexedFragment(1))
+        image.insert(1, IndexedFragment(0))
+        image.insert(-1, IndexedFragment(2))
+        self.assertEqual(len(image), 2)
+        self.assertEqual(len(image._rgba), 4 * len(image._idx))
+        self.assertEqual(str(image), 'bc')
+        image.put(-2, 0, IndexedFragment(0))
+        self.assertEqual(str(image), 'ac')
+        with self.assertRaises(IndexError):
+            image.insert(-3, IndexedFragment(0))
+    
+    def test_fragments_is_a_live_read_only_view(self):
+        image = TextImage(Config(Symbols(list('abc'))), 2, 2)
+        image.insert(0, IndexedFragment(1))
+        fragments = image.fragments
+        self.assertEqual(fragments, [IndexedFragment(1)])
+        image.insert(1, IndexedFragment(2))
+        self.assertEqual(len(fragments), 2)
+        self.assertEqual(fragments[-1].sym_index, 2)
+        with self.assertRaises(TypeError):
+            fragments[0] = IndexedFragment(0)
+        self.assertFalse(hasattr(fragments, 'append'))
+    
+    @unittest.skipIf(np is None, 'requires NumPy')
+    def test_column_arrays_do_not_pin_storage(self):
+        image = TextImage(Config(Symbols(list('abc'))), 2, 1)
+        image.write_indexed(1, (1, 2, 3, 255))
+        sym_idx, fg, packed = image.sym_idx, image.fg, image.packed_fg
+        for _ in range(4):
+            image.write_indexed(2, (0, 0, 0, 255))
+        self.assertEqual(sym_idx.tolist(), [1])
+        self.assertEqual(fg.tolist(), [[1, 2, 3, 255]])
+        self.assertEqual(packed.tolist(), [0xFF030201])
+        self.assertEqual(image.sym_idx.tolist(), [1, 2, 2, 2, 2])
+    
+    @unittest.skipIf(np is None, 'requires NumPy')
+    def test_write_frame_matches_per_pixel_writes(self):
+        width, height = 13, 7
+        pixels = _random_pixels(width * height)
+        frame = np.array(pixels, dtype=np.uint8).reshape(height, width, 4)
+        small = Symbols(list(' .:-=+*#%@'))
+        large = Symbols([chr(0x2500 + i) for i in range(300)])
+        
+        # (symbols the image is sized for, symbols the frame is converted with);
+        # the last pair needs more indices than a one-byte column holds.
+        for sized, converted in ((small, small), (large, large), (Symbols(list('ab') * 50), large)):
+            config = Config(sized, flags=COLORS)
+            expected = TextImage(config, width, height)
+            for pixel in pixels:
+                expected.write_indexed(converted.sym_index(pixel), pixel)
+            
+            image = TextImage(config, width, height)
+            image.write_frame(frame, converted)
+            
+            self.assertEqual(len(image), len(expected))
+            self.assertEqual(image._idx, expected._idx)
+            self.assertEqual(image._rgba, expected._rgba)
+            self.assertEqual(str(image), str(expected))
+    
+    @unittest.skipIf(np is None, 'requires NumPy')
+    def test_vectorized_color_render_matches_per_cell_render(self):
+        # A small palette with transparent entries makes runs of equal colors,
+        # color changes and uncolored cells inside and across rows.
+        rng = random.Random(2)
+        palette = [(255, 0, 0, 255), (0, 255, 0, 200), (9, 9, 9, 50), (0, 0, 0, 0)]
+        width, height = 9, 5
+        pixels = [rng.choice(palette) for _ in range(width * height)]
+        
+        for symbols in ('', '#', ' ░▒▓█', ' .:-=+*#%@'):
+            for flags in (COLORS, COLORS | REVERSE):
+                config = Config(Symbols(list(symbols)), flags=flags)
+                image = TextImage(config, width, height)
+                for n, pixel in enumerate(pixels):
+                    image.write_indexed(n % 12, pixel)
+                
+                vectorized = bytearray()
+                image._color_cells(vectorized)
+                per_cell = bytearray()
+                image._color_runs(per_cell)
+                self.assertEqual(vectorized, per_cell, (symbols, flags))
+
+
+if __name__ == '__main__':
+    unittest.main()